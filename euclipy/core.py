@@ -1,5 +1,5 @@
 from collections import namedtuple, defaultdict
-from functools import wraps
+from functools import wraps, cached_property
 import inspect
 import sympy
 import networkx
@@ -53,6 +53,27 @@ class TracedExpression:
     def __repr__(self):
         return f"{self.__class__.__name__}(expr={self.expr}, original_expr={self.original_expr}, obj={self.obj}, theorem='{self.theorem}', params={self.params}, substitutions={self.substitutions})"
 
+class ExpressionTemplate:
+    def __init__(self, builder):
+        """builder is a function whose parameters name the placeholders of the template and which returns a sympy.Expr built from them.
+        The builder is called once, with one placeholder symbol per parameter; instantiate() then only performs a single xreplace."""
+        self.names = tuple(inspect.signature(builder).parameters) # Names of the placeholders, in the order instantiate() expects their replacements
+        self.placeholders = tuple(sympy.Dummy(name) for name in self.names) # Dummies cannot collide with Measures or other user symbols
+        self.expr = builder(*self.placeholders) # The template expression, written in terms of the placeholders
+
+    def instantiate(self, *replacements):
+        """Return the template expression with each placeholder replaced by the corresponding replacement (e.g. a Measure), in order."""
+        assert len(replacements) == len(self.placeholders), f'Template expects {len(self.placeholders)} replacements'
+        return self.expr.xreplace(dict(zip(self.placeholders, replacements)))
+
+    @cached_property
+    def numeric(self):
+        """Lambdified form of the template expression, taking one number per placeholder (in order) and returning a number."""
+        return sympy.lambdify(self.placeholders, self.expr, modules='math')
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({', '.join(self.names)}: {self.expr})"
+
 class Solver:
     def __init__(self):
         self.expressions = [] # List of TracedExpressions
@@ -200,9 +221,15 @@ class GeometricObject:
     def from_points(cls, points: list) -> 'GeometricObject':
         return cls.__new__(cls, cls.label_from_points(points))
 
-    def add_expression(self, expr, **kwargs):
-        from_bound_method = getattr(self, inspect.getframeinfo(inspect.currentframe().f_back).function)
+    def add_expression(self, expr, from_bound_method=None, **kwargs):
+        """from_bound_method should be the @theorem-decorated bound method giving rise to expr. If omitted, it is looked up from the calling frame."""
+        if from_bound_method is None:
+            from_bound_method = getattr(self, inspect.getframeinfo(inspect.currentframe().f_back).function)
         self.solver.add_expression(expr, from_bound_method, **kwargs)
+
+    def add_template_expression(self, template, from_bound_method, *replacements, **kwargs):
+        """Instantiate template with replacements and add the resulting expression on behalf of from_bound_method."""
+        self.solver.add_expression(template.instantiate(*replacements), from_bound_method, **kwargs)
     
     def apply_all_theorems(self):
         for theorem in self._theorems:
@@ -1,7 +1,12 @@
 from .tools import euclicache, pairs_in_iterable
-from .core import Segment, Angle, GeometricObject, theorem, has_theorems, DIRECTED_GRAPH
+from .core import Segment, Angle, GeometricObject, ExpressionTemplate, theorem, has_theorems, DIRECTED_GRAPH
 from sympy import pi, asin, acos
 
+TRIANGLE_SUM_TEMPLATE = ExpressionTemplate(lambda a1, a2, a3: a1 + a2 + a3 - 180)
+PYTHAGOREAN_TEMPLATE = ExpressionTemplate(lambda l1, l2, hyp: l1 ** 2 + l2 ** 2 - hyp ** 2)
+SINE_TEMPLATE = ExpressionTemplate(lambda opposite, hyp, angle: asin(opposite / hyp) / pi * 180 - angle)
+COSINE_TEMPLATE = ExpressionTemplate(lambda adjacent, hyp, angle: acos(adjacent / hyp) / pi * 180 - angle)
+
 @has_theorems
 class Triangle(GeometricObject):
     """
@@ -85,24 +90,24 @@ class Triangle(GeometricObject):
 
     @theorem('Triangle Angle Sum Theorm')
     def triangle_sum_theorem(self) -> None:
-        self.add_expression(self.angles[0].measure + self.angles[1].measure + self.angles[2].measure - 180)
+        self.add_template_expression(TRIANGLE_SUM_TEMPLATE, self.triangle_sum_theorem, *[angle.measure for angle in self.angles])
 
     @theorem('Pythagorean Theorem')
     def pythagorean_theorem(self) -> None:
         if self.is_right_triangle():
             (l1, l2), hyp = self.legs, self.hypotenuse
-            self.add_expression(l1.measure ** 2 + l2.measure ** 2 - hyp.measure ** 2)
+            self.add_template_expression(PYTHAGOREAN_TEMPLATE, self.pythagorean_theorem, l1.measure, l2.measure, hyp.measure)
 
     @theorem('Sine Definitions')
     def sine_definitions(self) -> None:
         if self.is_right_triangle():
             (l1, l2), hyp = self.legs, self.hypotenuse
-            self.add_expression(asin(l1.measure / hyp.measure) / pi * 180 - self.angle_opposite_segment(l1).measure)
-            self.add_expression(asin(l2.measure / hyp.measure) / pi * 180 - self.angle_opposite_segment(l2).measure)
+            self.add_template_expression(SINE_TEMPLATE, self.sine_definitions, l1.measure, hyp.measure, self.angle_opposite_segment(l1).measure)
+            self.add_template_expression(SINE_TEMPLATE, self.sine_definitions, l2.measure, hyp.measure, self.angle_opposite_segment(l2).measure)
 
     @theorem('Cosine Definitions')
     def cosine_definitions(self) -> None:
         if self.is_right_triangle():
             (l1, l2), hyp = self.legs, self.hypotenuse
-            self.add_expression(acos(l1.measure / hyp.measure) / pi * 180 - self.angle_opposite_segment(l2).measure)
-            self.add_expression(acos(l2.measure / hyp.measure) / pi * 180 - self.angle_opposite_segment(l1).measure)
\ No newline at end of file
+            self.add_template_expression(COSINE_TEMPLATE, self.cosine_definitions, l1.measure, hyp.measure, self.angle_opposite_segment(l2).measure)
+            self.add_template_expression(COSINE_TEMPLATE, self.cosine_definitions, l2.measure, hyp.measure, self.angle_opposite_segment(l1).measure)
\ No newline at end of file
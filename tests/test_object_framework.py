@@ -4,6 +4,7 @@ sys.path.append('../')
 import pytest
 import networkx
 import numpy as np
+from sympy import asin, acos, pi
 
 from euclipy.core import *
 from euclipy.measure import *
@@ -35,4 +36,36 @@ def test_theorem_application():
     Triangle('A B C').solver.solve()
     Triangle("A B C").pythagorean_theorem()
     assert(Triangle('A B C').angles[2].measure.value == 90)
-    assert(Triangle('A B C').is_right_triangle())
\ No newline at end of file
+    assert(Triangle('A B C').is_right_triangle())
+
+def test_expression_templates():
+    a1, a2, a3 = [Triangle('D E F').angles[i].measure for i in range(3)]
+    assert(TRIANGLE_SUM_TEMPLATE.instantiate(a1, a2, a3) == a1 + a2 + a3 - 180)
+    l1, l2, hyp = [Triangle('D E F').edges[i].measure for i in range(3)]
+    assert(PYTHAGOREAN_TEMPLATE.instantiate(l1, l2, hyp) == l1 ** 2 + l2 ** 2 - hyp ** 2)
+    assert(PYTHAGOREAN_TEMPLATE.numeric(3, 4, 5) == 0)
+    assert(PYTHAGOREAN_TEMPLATE.numeric is PYTHAGOREAN_TEMPLATE.numeric)
+
+def test_right_triangle_templates():
+    triangle = Triangle('G H I')
+    triangle.angles[0].measure = 90
+    assert(triangle.is_right_triangle())
+    (l1, l2), hyp = triangle.legs, triangle.hypotenuse
+    opposite_l1, opposite_l2 = triangle.angle_opposite_segment(l1).measure, triangle.angle_opposite_segment(l2).measure
+    start = len(triangle.solver.expressions)
+    triangle.sine_definitions()
+    triangle.cosine_definitions()
+    assert([tracedexpr.original_expr for tracedexpr in triangle.solver.expressions[start:]] == [
+        asin(l1.measure / hyp.measure) / pi * 180 - opposite_l1,
+        asin(l2.measure / hyp.measure) / pi * 180 - opposite_l2,
+        acos(l1.measure / hyp.measure) / pi * 180 - opposite_l2,
+        acos(l2.measure / hyp.measure) / pi * 180 - opposite_l1,
+    ])
+
+def test_template_theorem_identity():
+    triangle = Triangle('J K L')
+    triangle.triangle_sum_theorem()
+    tracedexpr = triangle.solver.expressions[-1]
+    assert(tracedexpr.theorem == 'triangle_sum_theorem')
+    assert(tracedexpr.obj is triangle)
+    assert(tracedexpr.title == 'Triangle Angle Sum Theorm')